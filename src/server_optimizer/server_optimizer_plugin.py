@@ -1,5 +1,6 @@
 import time
 import gc # Keep garbage collector for memory cleanup
+from functools import partial
 from collections import defaultdict, deque
 from typing import Dict, List, Set, Optional
 
@@ -15,6 +16,45 @@ from endstone.event import (
 from endstone.plugin import Plugin
 from endstone.player import Player # Added for type hinting
 
+# Lookup tables indexed by int(tps) (0..20) and health_score // 20 (0..5)
+_TPS_COLORS = ("§c",) * 15 + ("§6",) * 3 + ("§e",) + ("§a",) * 2
+_TPS_STATUSES = ("Poor",) * 15 + ("Fair",) * 3 + ("Good",) + ("Excellent",) * 2
+_HEALTH_COLORS = ("§c", "§c", "§6", "§e", "§a", "§a")
+
+
+class RollingWindow:
+    """Fixed-size ring buffer that keeps a running sum, so the mean is O(1)."""
+
+    __slots__ = ("size", "count", "total", "_buf", "_idx")
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self.count = 0
+        self.total = 0.0
+        self._buf = [0.0] * size
+        self._idx = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def append(self, value: float) -> None:
+        idx = self._idx
+        self.total += value - self._buf[idx]
+        self._buf[idx] = value
+        idx += 1
+        if idx == self.size:
+            idx = 0
+            # Re-sum once per lap so floating point drift can't accumulate
+            self.total = sum(self._buf)
+        self._idx = idx
+        if self.count < self.size:
+            self.count += 1
+
+    def mean(self, default: float = 0.0) -> float:
+        if self.count == 0:
+            return default
+        return self.total / self.count
+
 
 class ServerOptimizerPlugin(Plugin):
     prefix = "ServerOptimizer"
@@ -75,18 +115,45 @@ class ServerOptimizerPlugin(Plugin):
         },
     }
 
+    ADMIN_PERM = "serveropt.admin"
+
+    # Task periods in ticks (20 ticks = 1 second)
+    _PERIOD_MONITOR = 1            # Performance monitoring (every tick)
+    _PERIOD_FAST_CHECK = 200       # Fast optimization check (every 10 seconds)
+    _PERIOD_AUTO_OPTIMIZE = 600    # Auto-optimization (every 30 seconds)
+    _PERIOD_CHUNK_CLEANUP = 1200   # Chunk cleanup (every 60 seconds)
+    _PERIOD_VIEW_DISTANCE = 300    # View distance adjuster (every 15 seconds)
+    _PERIOD_MEMORY_CLEANUP = 6000  # Memory cleanup (every 5 minutes)
+    _PERIOD_DISPLAY = 40           # Performance display (every 2 seconds)
+    _PERIOD_OVERLOAD = 60          # Overload monitoring (every 3 seconds)
+    _PERIOD_HEALTH = 100           # Health check (every 5 seconds)
+
+    # First-run delays that differ from the task's period
+    _DELAY_AUTO_OPTIMIZE = 100     # First auto-optimization after 5 seconds
+    _DELAY_CHUNK_CLEANUP = 200     # First chunk cleanup after 10 seconds
+
+    # Constant banner lines for /optimize status
+    _STATUS_HEADER = (
+        "§e§l═══════════════════",
+        "§e§l   Server Status",
+        "§e§l═══════════════════",
+    )
+    _STATUS_FOOTER = ("§e§l═══════════════════",)
+
     def on_load(self) -> None:
         self.logger.info("=== Server Optimizer Pro Loading ===")
         
         # Performance tracking
-        self.tick_times: deque = deque(maxlen=200)
-        self.tps_history: deque = deque(maxlen=60)
-        self.last_tick = time.time()
+        self.tick_times = RollingWindow(200)
+        self.tps_history = RollingWindow(60)
+        self.last_tick = time.monotonic()  # Monotonic: immune to wall-clock (NTP) jumps
+        self._cached_tps = 20.0
+        self._cached_tps_at: Optional[float] = None
         
         # Auto-optimization settings
         self.auto_optimize = True
         self.aggressive_mode = False
-        self.last_optimization = 0
+        self.last_optimization = float("-inf")
         self.optimization_interval = 120
         
         # Entity limits (Placeholder/Configuration)
@@ -99,7 +166,7 @@ class ServerOptimizerPlugin(Plugin):
         }
         
         # Chunk management
-        self.loaded_chunks: Dict[str, int] = defaultdict(int)
+        self.estimated_chunks = 0
         self.chunk_unload_threshold = 300
         self.max_chunks_per_player = 64
         
@@ -115,6 +182,11 @@ class ServerOptimizerPlugin(Plugin):
         self.afk_players: Set[str] = set()
         self.afk_threshold = 180
         
+        # Online player count, kept in step with the name index on join/quit
+        self._player_count = 0
+        self._admins: Set[str] = set()  # Lowercase names of admins seen on join/enable
+        self._players_by_name_lower: Dict[str, Player] = {}
+        
         # Performance thresholds
         self.tps_target = 19.0
         self.tps_critical = 15.0
@@ -126,7 +198,7 @@ class ServerOptimizerPlugin(Plugin):
         self.entities_removed_total = 0
         
         # Alert cooldowns
-        self.last_lag_alert = 0
+        self.last_lag_alert = float("-inf")
         self.lag_alert_cooldown = 60
         
         # Crash recovery tracking
@@ -135,15 +207,18 @@ class ServerOptimizerPlugin(Plugin):
         
         # Performance viewer tracking
         self.performance_viewers: Set[str] = set()
+        self._popup_queue: List[Player] = []
+        self._popup_text = ""
         
         # Overload protection
         self.max_players_warning = 80
         self.max_players_critical = 100
         self.max_chunks_warning = 3000
         self.max_chunks_critical = 5000
+        self._overload_last = (-1, -1)
         
         # Task execution monitoring
-        self.task_execution_times: Dict[str, List[float]] = defaultdict(list)
+        self.task_execution_times: Dict[str, deque] = defaultdict(lambda: deque(maxlen=10))
         self.max_task_duration = 0.05
         self.slow_tasks: Set[str] = set()
         
@@ -152,9 +227,37 @@ class ServerOptimizerPlugin(Plugin):
         self.memory_warning_threshold = 80.0
         self.memory_critical_threshold = 90.0
         
+        # Adaptive GC for the periodic memory cleanup
+        self.gc_idle_gen2_count = 100
+        self.gc_idle_players = 5
+        self.gc_full_every = 4
+        self._memory_cleanups = 0
+        
         # Server health score
         self.health_score = 100
-        self.health_history: deque = deque(maxlen=60)
+        self.health_history = RollingWindow(60)
+        
+        # /optimize subcommand handlers
+        self._opt_dispatch = {
+            "status": self._cmd_status,
+            "full": self._cmd_full,
+            "view": self.handle_performance_view,
+        }
+        
+        # Unified task dispatcher: (period, first-run delay, task) in ticks
+        self._tick = 0
+        self._jobs = (
+            (self._PERIOD_MONITOR, 0, self.monitor_performance),
+            (self._PERIOD_FAST_CHECK, self._PERIOD_FAST_CHECK, self.fast_optimization_check),
+            (self._PERIOD_AUTO_OPTIMIZE, self._DELAY_AUTO_OPTIMIZE, self.auto_optimize_task),
+            (self._PERIOD_CHUNK_CLEANUP, self._DELAY_CHUNK_CLEANUP, self.cleanup_chunks),
+            (self._PERIOD_VIEW_DISTANCE, self._PERIOD_VIEW_DISTANCE, self.adjust_view_distance),
+            (self._PERIOD_MEMORY_CLEANUP, self._PERIOD_MEMORY_CLEANUP, self.periodic_memory_cleanup),
+            (self._PERIOD_DISPLAY, self._PERIOD_DISPLAY, self.update_performance_display),
+            (self._PERIOD_OVERLOAD, self._PERIOD_OVERLOAD, self.monitor_overload),
+            (self._PERIOD_HEALTH, self._PERIOD_HEALTH, self.check_server_health),
+            # detect_afk_players and monitor_memory are stubs; schedule them once they do something
+        )
 
     def on_enable(self) -> None:
         self.logger.info("=== Server Optimizer Enabled (made by SvvXD)===")
@@ -162,72 +265,55 @@ class ServerOptimizerPlugin(Plugin):
         # Register event listeners
         self.register_events(self)
         
-        # Wrap all tasks in try-except
-        def safe_task(task_func):
-            def wrapper():
-                try:
-                    task_func()
-                except Exception as e:
-                    self.logger.error(f"Task error: {e}")
-            return wrapper
-        
-        # Performance monitoring (runs every tick)
-        self.server.scheduler.run_task(
-            self, safe_task(self.monitor_performance), delay=0, period=1
-        )
-        
-        # Fast optimization check (runs every 10 seconds)
-        self.server.scheduler.run_task(
-            self, safe_task(self.fast_optimization_check), delay=200, period=200
-        )
-        
-        # Auto-optimization (runs every 30 seconds)
-        self.server.scheduler.run_task(
-            self, safe_task(self.auto_optimize_task), delay=100, period=600
-        )
-        
-        # Chunk cleanup (runs every 60 seconds)
-        self.server.scheduler.run_task(
-            self, safe_task(self.cleanup_chunks), delay=200, period=1200
-        )
-        
-        # AFK detection (runs every 30 seconds)
-        self.server.scheduler.run_task(
-            self, safe_task(self.detect_afk_players), delay=300, period=600
-        )
-        
-        # View distance adjuster (runs every 15 seconds)
-        self.server.scheduler.run_task(
-            self, safe_task(self.adjust_view_distance), delay=300, period=300
-        )
-        
-        # Memory cleanup (runs every 5 minutes)
-        self.server.scheduler.run_task(
-            self, safe_task(self.periodic_memory_cleanup), delay=6000, period=6000
-        )
-        
-        # Performance display (runs every 2 seconds)
-        self.server.scheduler.run_task(
-            self, safe_task(self.update_performance_display), delay=40, period=40
-        )
+        # Pick up admins who were already online (e.g. after a reload)
+        self._admins.clear()
+        self._players_by_name_lower.clear()
+        for player in self.server.online_players:
+            self._players_by_name_lower[player.name.lower()] = player
+            if self._is_admin(player):
+                self._admins.add(player.name.lower())
+        self._player_count = len(self._players_by_name_lower)
+        
+        # Single master tick; every optimization task is dispatched from here.
+        # Restart the schedule and its change-detection caches so a re-enable
+        # doesn't inherit stale state from the previous run.
+        self._tick = 0
+        self._popup_queue.clear()
+        self.last_tick = time.monotonic()
+        self._cached_tps_at = None
+        self._overload_last = (-1, -1)
+        self.server.scheduler.run_task(self, self._dispatch, delay=0, period=1)
         
-        # Overload monitoring (runs every 3 seconds)
-        self.server.scheduler.run_task(
-            self, safe_task(self.monitor_overload), delay=60, period=60
-        )
+        self.logger.info("All optimization tasks started!")
+        self.logger.info("Crash protection: ENABLED")
+
+    def _dispatch(self) -> None:
+        """Runs every scheduled task whose period falls on the current tick."""
+        tick = self._tick
+        self._tick = tick + 1
         
-        # Health check (runs every 5 seconds)
-        self.server.scheduler.run_task(
-            self, safe_task(self.check_server_health), delay=100, period=100
-        )
+        for period, delay, task in self._jobs:
+            if tick >= delay and (tick - delay) % period == 0:
+                try:
+                    task()
+                except Exception as e:
+                    self.logger.error(f"Task error ({task.__name__}): {e}")
         
-        # Memory monitoring (runs every 10 seconds - simplified)
-        self.server.scheduler.run_task(
-            self, safe_task(self.monitor_memory), delay=200, period=200
-        )
+        # Send popups queued by this tick's tasks
+        if self._popup_queue:
+            try:
+                self._flush_popups()
+            except Exception as e:
+                self.logger.error(f"Task error (_flush_popups): {e}")
+
+    def _flush_popups(self) -> None:
+        """Sends the queued popup to every queued viewer in one pass at tick end."""
+        queue = self._popup_queue
+        self._popup_queue = []
+        text = self._popup_text
         
-        self.logger.info("All optimization tasks started!")
-        self.logger.info("Crash protection: ENABLED")
+        for player in queue:
+            player.send_popup(text)
 
     def on_disable(self) -> None:
         self.logger.info("=== Server Optimizer Disabled ===")
@@ -258,21 +344,23 @@ class ServerOptimizerPlugin(Plugin):
             return True
 
         action = args[0].lower()
-        
-        if action == "status":
-            self.show_detailed_status(sender)
-        elif action == "full":
-            sender.send_message("§e[Optimizer] Running full optimization...")
-            self.optimize_chunks()
-            self.optimize_entities()
-            self.optimize_memory()
-            sender.send_message(f"§a✓ Optimization Complete!")
-        elif action == "view":
-            return self.handle_performance_view(sender, args)
-        else:
+        handler = self._opt_dispatch.get(action)
+        if handler is None:
             sender.send_error_message(f"§cUnknown optimize subcommand: {action}")
             return False
         
+        return handler(sender, args)
+
+    def _cmd_status(self, sender: CommandSender, args: list[str]) -> bool:
+        self.show_detailed_status(sender)
+        return True
+
+    def _cmd_full(self, sender: CommandSender, args: list[str]) -> bool:
+        sender.send_message("§e[Optimizer] Running full optimization...")
+        self.optimize_chunks()
+        self.optimize_entities()
+        self.optimize_memory()
+        sender.send_message(f"§a✓ Optimization Complete!")
         return True
 
     def handle_tps_command(self, sender: CommandSender) -> bool:
@@ -283,7 +371,7 @@ class ServerOptimizerPlugin(Plugin):
 
     def handle_lag_command(self, sender: CommandSender) -> bool:
         tps = self.calculate_tps()
-        online_players = len(self.server.online_players)
+        online_players = self._player_count
         sender.send_message("§e§l=== LAG Report ===")
         sender.send_message(f"§eTPS: §f{tps:.2f}§e/20.0")
         sender.send_message(f"§ePlayers: §f{online_players}")
@@ -333,12 +421,7 @@ class ServerOptimizerPlugin(Plugin):
             return True
         
         target_name = args[1]
-        target_player: Optional[Player] = None
-        
-        for player in self.server.online_players:
-            if player.name.lower() == target_name.lower():
-                target_player = player
-                break
+        target_player: Optional[Player] = self._players_by_name_lower.get(target_name.lower())
         
         if target_player is None:
             sender.send_error_message(f"§cPlayer not found: {target_name}")
@@ -358,38 +441,47 @@ class ServerOptimizerPlugin(Plugin):
     def show_detailed_status(self, sender: CommandSender) -> None:
         tps = self.calculate_tps()
         color = self.get_tps_color(tps)
-        online = len(self.server.online_players)
+        online = self._player_count
         
-        sender.send_message("§e§l═══════════════════")
-        sender.send_message("§e§l   Server Status")
-        sender.send_message("§e§l═══════════════════")
+        for line in self._STATUS_HEADER:
+            sender.send_message(line)
         sender.send_message(f"§eTPS: {color}{tps:.2f}§e/20.0")
         sender.send_message(f"§eHealth: {self.get_health_color()}{self.health_score}§e/100")
         sender.send_message(f"§ePlayers: §f{online}")
         sender.send_message(f"§eView Distance: §f{self.current_view_distance}")
         sender.send_message(f"§eOptimization Total: §f{self.total_optimizations}")
-        sender.send_message("§e§l═══════════════════")
+        for line in self._STATUS_FOOTER:
+            sender.send_message(line)
 
     def monitor_performance(self) -> None:
-        try:
-            current_time = time.time()
-            tick_duration = current_time - self.last_tick
-            self.last_tick = current_time
-            
-            self.tick_times.append(tick_duration)
-            tps = self.calculate_tps()
-            self.tps_history.append(tps)
-            
-            online_players = len(self.server.online_players)
-            estimated_chunks = online_players * self.max_chunks_per_player
-            self.loaded_chunks["estimated"] = estimated_chunks
-            
-            # Notify admins of severe lag
-            if tps < self.tps_critical:
-                self.notify_admins_lag(tps)
-
-        except Exception as e:
-            self.logger.error(f"Performance monitoring error: {e}")
+        current_time = time.monotonic()
+        tick_duration = current_time - self.last_tick
+        self.last_tick = current_time
+        
+        self.tick_times.append(tick_duration)
+        tps = self._cached_tps = self._compute_tps_now()
+        self._cached_tps_at = current_time
+        self.tps_history.append(tps)
+        
+        self.estimated_chunks = self._player_count * self.max_chunks_per_player
+        
+        # Notify admins of severe lag
+        if tps < self.tps_critical:
+            self.notify_admins_lag(tps)
+
+    def _is_admin(self, player: Player) -> bool:
+        return player.is_op or player.has_permission(self.ADMIN_PERM)
+
+    def _online_admins(self) -> List[Player]:
+        """Resolves the cached admin names, dropping anyone who has left or been de-op'd."""
+        admins = []
+        for name in list(self._admins):
+            player = self._players_by_name_lower.get(name)
+            if player is not None and self._is_admin(player):
+                admins.append(player)
+            else:
+                self._admins.discard(name)
+        return admins
 
     def fast_optimization_check(self) -> None:
         if not self.auto_optimize:
@@ -404,7 +496,7 @@ class ServerOptimizerPlugin(Plugin):
         if not self.auto_optimize:
             return
         
-        current_time = time.time()
+        current_time = time.monotonic()
         tps = self.calculate_tps()
         
         # Optimize if TPS is low or enough time has passed
@@ -421,9 +513,9 @@ class ServerOptimizerPlugin(Plugin):
             return
         
         # Placeholder for actual chunk unloading logic
-        if self.loaded_chunks.get("estimated", 0) > 500:
-            to_clear = self.loaded_chunks.get("estimated", 500) - 500
-            self.loaded_chunks.clear()
+        if self.estimated_chunks > 500:
+            to_clear = self.estimated_chunks - 500
+            self.estimated_chunks = 0
             self.chunks_cleared_total += to_clear
             self.logger.info(f"Aggressive chunk cleanup: {to_clear} chunks cleared (estimated).")
             # In a real plugin, you would call the Endstone API to unload chunks here
@@ -437,31 +529,48 @@ class ServerOptimizerPlugin(Plugin):
             return
         
         tps = self.calculate_tps()
-        target_vd = self.current_view_distance
-        
-        if tps >= 19.5 and self.current_view_distance < self.max_view_distance:
-            target_vd = min(self.max_view_distance, self.current_view_distance + 1)
-        elif tps < 17.0 and self.current_view_distance > self.min_view_distance:
-            target_vd = max(self.min_view_distance, self.current_view_distance - 1)
+        current_vd = target_vd = self.current_view_distance
+        min_vd = self.min_view_distance
+        max_vd = self.max_view_distance
+        
+        if tps >= 19.5 and current_vd < max_vd:
+            target_vd = min(max_vd, current_vd + 1)
+        elif tps < 17.0 and current_vd > min_vd:
+            target_vd = max(min_vd, current_vd - 1)
         elif tps < self.tps_critical:
-            target_vd = self.min_view_distance
+            target_vd = min_vd
         
-        if target_vd != self.current_view_distance:
+        if target_vd != current_vd:
             self.current_view_distance = target_vd
             self.logger.info(f"Adjusted view distance to {self.current_view_distance} due to TPS of {tps:.2f}")
 
     def periodic_memory_cleanup(self) -> None:
-        if self.auto_optimize:
+        if not self.auto_optimize:
+            return
+        
+        # Don't add GC pauses on top of a server that is already lagging
+        if self.calculate_tps() < self.tps_warning:
+            return
+        
+        # Skip while allocation churn is low on a quiet server
+        if gc.get_count()[2] < self.gc_idle_gen2_count and self._player_count < self.gc_idle_players:
+            return
+        
+        # Young generations most of the time, a full collection every few runs
+        self._memory_cleanups += 1
+        if self._memory_cleanups % self.gc_full_every == 0:
             self.optimize_memory()
+        else:
+            gc.collect(1)
 
     def optimize_chunks(self) -> int:
         count = 0
         threshold = 300 if self.aggressive_mode else 500
         
-        estimated_chunks = self.loaded_chunks.get("estimated", 0)
+        estimated_chunks = self.estimated_chunks
         if estimated_chunks > threshold:
             count = estimated_chunks - threshold
-            self.loaded_chunks.clear() # Simulate clearing
+            self.estimated_chunks = 0 # Simulate clearing
             self.chunks_cleared_total += count
             
             # In a real plugin, call Endstone API to unload chunks here
@@ -480,15 +589,19 @@ class ServerOptimizerPlugin(Plugin):
         self.logger.info("Garbage Collector executed.")
 
     def calculate_tps(self) -> float:
-        """Calculates the current TPS based on the last 20 tick durations."""
-        if len(self.tick_times) < 20:
+        """Returns the current TPS, reusing the value already computed this tick."""
+        if self._cached_tps_at == self.last_tick:
+            return self._cached_tps
+        return self._compute_tps_now()
+
+    def _compute_tps_now(self) -> float:
+        """Calculates the current TPS from the running tick-duration window."""
+        tick_times = self.tick_times
+        if tick_times.count < 20:
             return 20.0
         
-        # Use a slice for the last 20 elements
-        recent_ticks = self.tick_times
-        avg_tick_time = sum(recent_ticks) / len(recent_ticks)
-        
-        if avg_tick_time == 0:
+        avg_tick_time = tick_times.mean()
+        if avg_tick_time <= 0:
             return 20.0
         
         tps = min(20.0, 1.0 / avg_tick_time)
@@ -496,101 +609,82 @@ class ServerOptimizerPlugin(Plugin):
 
     def get_average_tps(self) -> float:
         """Calculates the average TPS over the history."""
-        if not self.tps_history:
-            return 20.0
-        return sum(self.tps_history) / len(self.tps_history)
+        return self.tps_history.mean(default=20.0)
 
     def get_tps_color(self, tps: float) -> str:
-        if tps >= 19:
-            return "§a" # Green
-        elif tps >= 18:
-            return "§e" # Yellow
-        elif tps >= 15:
-            return "§6" # Gold
-        else:
-            return "§c" # Red
+        # Green >= 19, Yellow >= 18, Gold >= 15, Red below
+        return _TPS_COLORS[min(20, max(0, int(tps)))]
 
     def get_tps_status(self, tps: float) -> str:
-        if tps >= 19:
-            return "Excellent"
-        elif tps >= 18:
-            return "Good"
-        elif tps >= 15:
-            return "Fair"
-        else:
-            return "Poor"
+        return _TPS_STATUSES[min(20, max(0, int(tps)))]
 
     def get_health_color(self) -> str:
-        if self.health_score >= 80:
-            return "§a"
-        elif self.health_score >= 60:
-            return "§e"
-        elif self.health_score >= 40:
-            return "§6"
-        else:
-            return "§c"
+        return _HEALTH_COLORS[min(5, max(0, self.health_score // 20))]
 
     def notify_admins_lag(self, tps: float) -> None:
-        current_time = time.time()
+        current_time = time.monotonic()
         
         if current_time - self.last_lag_alert < self.lag_alert_cooldown:
             return
         
         self.last_lag_alert = current_time
         
-        for player in self.server.online_players:
-            # Check if player has serveropt.admin or is OP
-            if player.is_op or player.has_permission("serveropt.admin"):
-                color = self.get_tps_color(tps)
-                player.send_message(f"§c[Optimizer] ⚠ WARNING: Low TPS: {color}{tps:.2f}§c/20.0")
+        admins = self._online_admins()
+        if not admins:
+            return
+        
+        message = f"§c[Optimizer] ⚠ WARNING: Low TPS: {self.get_tps_color(tps)}{tps:.2f}§c/20.0"
+        for player in admins:
+            player.send_message(message)
 
     def monitor_overload(self) -> None:
-        try:
-            overload_detected = False
-            overload_reasons = []
-            
-            online_players = len(self.server.online_players)
-            if online_players >= self.max_players_critical:
-                overload_detected = True
-                overload_reasons.append(f"Players: {online_players}")
-            
-            estimated_chunks = self.loaded_chunks.get("estimated", 0)
-            if estimated_chunks >= self.max_chunks_critical:
-                overload_detected = True
-                overload_reasons.append(f"Chunks: {estimated_chunks}")
-            
-            # Check memory usage (simplified, as psutil was removed)
-            # if self.get_memory_usage() >= self.memory_critical_threshold:
-            #     overload_detected = True
-            #     overload_reasons.append(f"Memory: {self.get_memory_usage():.1f}%")
-            
-            if overload_detected:
-                self.logger.error(f"=== OVERLOAD DETECTED: {', '.join(overload_reasons)} ===")
-                self.emergency_crash_recovery()
-            
-        except Exception as e:
-            self.logger.error(f"Overload monitoring failed: {e}")
+        online_players = self._player_count
+        estimated_chunks = self.estimated_chunks
+        
+        # Nothing moved since the last healthy check
+        key = (online_players, estimated_chunks)
+        if key == self._overload_last:
+            return
+        
+        overload_detected = False
+        overload_reasons = []
+        
+        if online_players >= self.max_players_critical:
+            overload_detected = True
+            overload_reasons.append(f"Players: {online_players}")
+        
+        if estimated_chunks >= self.max_chunks_critical:
+            overload_detected = True
+            overload_reasons.append(f"Chunks: {estimated_chunks}")
+        
+        # Check memory usage (simplified, as psutil was removed)
+        # if self.get_memory_usage() >= self.memory_critical_threshold:
+        #     overload_detected = True
+        #     overload_reasons.append(f"Memory: {self.get_memory_usage():.1f}%")
+        
+        if overload_detected:
+            # Don't cache an overloaded state so recovery keeps firing while it lasts
+            self._overload_last = (-1, -1)
+            self.logger.error(f"=== OVERLOAD DETECTED: {', '.join(overload_reasons)} ===")
+            self.emergency_crash_recovery()
+        else:
+            self._overload_last = key
 
     def check_server_health(self) -> None:
-        try:
+        tps = self.calculate_tps()
+        
+        # Simple health calculation based on TPS
+        if tps >= 19.5:
             health = 100
-            tps = self.calculate_tps()
-            
-            # Simple health calculation based on TPS
-            if tps >= 19.5:
-                health = 100
-            elif tps >= 18:
-                health = 80
-            elif tps >= 15:
-                health = 60
-            else:
-                health = 40
-            
-            self.health_score = health
-            self.health_history.append(health)
-            
-        except Exception as e:
-            self.logger.error(f"Health check failed: {e}")
+        elif tps >= 18:
+            health = 80
+        elif tps >= 15:
+            health = 60
+        else:
+            health = 40
+        
+        self.health_score = health
+        self.health_history.append(health)
 
     def monitor_memory(self) -> None:
         """
@@ -608,79 +702,70 @@ class ServerOptimizerPlugin(Plugin):
         return 0.0 # Returning 0.0 as a safe default
 
     def monitor_task_performance(self, task_name: str, duration: float) -> None:
-        try:
-            # This would ideally be integrated into the scheduler wrappers to measure task execution time
-            self.task_execution_times[task_name].append(duration)
-            
-            if len(self.task_execution_times[task_name]) > 10:
-                self.task_execution_times[task_name].pop(0)
-            
-            if duration > self.max_task_duration:
-                if task_name not in self.slow_tasks:
-                    self.slow_tasks.add(task_name)
-                    self.logger.warning(f"Slow task detected: {task_name} took {duration:.4f}s")
-            else:
-                if task_name in self.slow_tasks:
-                    self.slow_tasks.remove(task_name)
-        except Exception as e:
-            self.logger.error(f"Task monitoring failed: {e}")
+        # This would ideally be integrated into the scheduler wrappers to measure task execution time
+        # Bounded deque drops the oldest sample on its own
+        self.task_execution_times[task_name].append(duration)
+        
+        if duration > self.max_task_duration:
+            if task_name not in self.slow_tasks:
+                self.slow_tasks.add(task_name)
+                self.logger.warning(f"Slow task detected: {task_name} took {duration:.4f}s")
+        else:
+            if task_name in self.slow_tasks:
+                self.slow_tasks.remove(task_name)
 
     def emergency_crash_recovery(self) -> None:
-        try:
-            self.logger.warning("=== EMERGENCY CRASH RECOVERY ACTIVATED ===")
-            
-            # Drop view distance to minimum
-            old_vd = self.current_view_distance
-            self.current_view_distance = self.min_view_distance
-            
-            # Activate aggressive mode
-            self.aggressive_mode = True
-            
-            # Force immediate optimization
-            self.optimize_chunks()
-            self.optimize_entities()
-            self.optimize_memory()
-            
-            for player in self.server.online_players:
-                if player.is_op or player.has_permission("serveropt.admin"):
-                    player.send_message("§c§l[EMERGENCY] §cEmergency optimization activated! View distance lowered.")
-            
-            self.logger.warning("=== EMERGENCY RECOVERY COMPLETE. Restoration scheduled. ===")
-            
-            # Schedule restoration to normal settings after 5 minutes (6000 ticks)
-            def restore_normal():
-                self.current_view_distance = self.base_view_distance
-                self.aggressive_mode = False
-                self.logger.info("Normal optimization settings restored.")
-            
-            self.server.scheduler.run_task(self, restore_normal, delay=6000)
-            
-        except Exception as e:
-            self.logger.error(f"Emergency recovery failed: {e}")
+        self.logger.warning("=== EMERGENCY CRASH RECOVERY ACTIVATED ===")
+        
+        # Drop view distance to minimum
+        old_vd = self.current_view_distance
+        self.current_view_distance = self.min_view_distance
+        
+        # Activate aggressive mode
+        self.aggressive_mode = True
+        
+        # Force immediate optimization
+        self.optimize_chunks()
+        self.optimize_entities()
+        self.optimize_memory()
+        
+        for player in self._online_admins():
+            player.send_message("§c§l[EMERGENCY] §cEmergency optimization activated! View distance lowered.")
+        
+        self.logger.warning("=== EMERGENCY RECOVERY COMPLETE. Restoration scheduled. ===")
+        
+        # Schedule restoration to normal settings after 5 minutes (6000 ticks)
+        self.server.scheduler.run_task(self, self.restore_normal, delay=6000)
+
+    def restore_normal(self) -> None:
+        self.current_view_distance = self.base_view_distance
+        self.aggressive_mode = False
+        self.logger.info("Normal optimization settings restored.")
 
     def update_performance_display(self) -> None:
-        try:
-            if not self.performance_viewers:
-                return
-            
-            tps = self.calculate_tps()
-            color = self.get_tps_color(tps)
-            online = len(self.server.online_players)
+        if not self.performance_viewers:
+            return
+        
+        tps = self.calculate_tps()
+        color = self.get_tps_color(tps)
+        online = self._player_count
+        
+        display_text = f"§e§l[OPT] {color}TPS: {tps:.1f}§r/20.0 §ePlayers: {online} §eVD: {self.current_view_distance}"
+        
+        # Popups fade after a few seconds, so resend every update even when unchanged
+        # Every viewer shares the same payload; sending happens in _flush_popups
+        self._popup_text = display_text
+        queue = self._popup_queue
+        
+        # Iterate over a copy of the set to allow modification if a player is missing
+        for player_name in list(self.performance_viewers):
+            player: Optional[Player] = self._players_by_name_lower.get(player_name.lower())
             
-            display_text = f"§e§l[OPT] {color}TPS: {tps:.1f}§r/20.0 §ePlayers: {online} §eVD: {self.current_view_distance}"
+            if player is None:
+                self.performance_viewers.discard(player_name)
+                continue
             
-            # Iterate over a copy of the set to allow modification if a player is missing
-            for player_name in list(self.performance_viewers):
-                player: Optional[Player] = self.server.get_player(player_name)
-                
-                if player is None:
-                    self.performance_viewers.remove(player_name)
-                    continue
-                
-                player.send_popup(display_text)
-                
-        except Exception as e:
-            self.logger.error(f"Performance display failed: {e}")
+            queue.append(player)
 
     @event_handler
     def on_server_load(self, event: ServerLoadEvent) -> None:
@@ -689,23 +774,30 @@ class ServerOptimizerPlugin(Plugin):
     @event_handler(priority=EventPriority.MONITOR)
     def on_player_join(self, event: PlayerJoinEvent) -> None:
         player = event.player
+        self._players_by_name_lower[player.name.lower()] = player
+        self._player_count = len(self._players_by_name_lower)
         
         # Check if they are OP or have admin permission
-        if player.is_op or player.has_permission("serveropt.admin"):
-            def send_info():
-                # Re-check permission in case it changed
-                if player.is_op or player.has_permission("serveropt.admin"):
-                    tps = self.calculate_tps()
-                    color = self.get_tps_color(tps)
-                    player.send_message("§e§l[Server Optimizer (By SvvXD)]")
-                    player.send_message(f"§7Current TPS: {color}{tps:.2f}§7/20.0")
-            
-            self.server.scheduler.run_task(self, send_info, delay=40)
+        if self._is_admin(player):
+            self._admins.add(player.name.lower())
+            self.server.scheduler.run_task(self, partial(self.send_join_info, player), delay=40)
+
+    def send_join_info(self, player: Player) -> None:
+        # Re-check permission in case it changed
+        if self._is_admin(player):
+            tps = self.calculate_tps()
+            color = self.get_tps_color(tps)
+            player.send_message("§e§l[Server Optimizer (By SvvXD)]")
+            player.send_message(f"§7Current TPS: {color}{tps:.2f}§7/20.0")
 
     @event_handler
     def on_player_quit(self, event: PlayerQuitEvent) -> None:
         player_name = event.player.name
         
+        self._admins.discard(player_name.lower())
+        self._players_by_name_lower.pop(player_name.lower(), None)
+        self._player_count = len(self._players_by_name_lower)
+        
         if player_name in self.afk_players:
             self.afk_players.remove(player_name)
         